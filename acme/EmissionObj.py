@@ -21,6 +21,18 @@ class EmissionObj:
         1              :class:`.DisruptorPlatform`
         ============== ===========================
 
+    KIND : int
+        The integer indicating the class of emission object.
+
+        ======== ======================
+        ``KIND`` Description
+        ======== ======================
+        0        :class:`EmissionObj`
+        1        :class:`Packet`
+        2        :class:`AckPacket`
+        3        :class:`DisruptionToken`
+        ======== ======================
+
     destID : any
         The identification attribute :attr:`.id` of the destination 
         :class:`.CommsPlatform`.
@@ -36,8 +48,45 @@ class EmissionObj:
     position : numpy.ndarray
         The position of the platform (:attr:`.pos`) at the time this 
         object was placed in the :class:`.Environment`.
+
+    Note
+    ----
+    Instances of the concrete emission classes are pooled to avoid 
+    allocating new objects every time step.
+    Use :meth:`acquire` to obtain a new object and :meth:`release` to 
+    return an object that is no longer referenced back to the pool.
     """
 
+    __slots__ = ('sourceID', 'destID', 'time', 'emissionTime', 'freqBin', 'position')
+
+    # Emission class (compared instead of using isinstance)
+    KIND = 0
+
+    # Maximum number of released objects kept for reuse by each emission class
+    _maxPoolSize = 1024
+
+    def __init_subclass__ ( cls, **kwargs ):
+        # Only called from Python 3.6, otherwise the Environment rejects unknown types when emitted
+        super().__init_subclass__(**kwargs)
+
+        # Ensure source platform type is known (0 indicates CommsPlatform, 1 indicates DisruptorPlatform)
+        if getattr(cls, 'sourceType', None) not in (0, 1):
+            raise Exception('Unknown emission type.')
+
+    @classmethod
+    def _getPool ( cls ):
+        """
+        The released objects of this class available for reuse.
+        Pool is separate for each class, and is created on first use.
+        """
+
+        # Look in this class only, as an inherited pool belongs to the parent class
+        thePool = cls.__dict__.get('_pool')
+        if thePool is None:
+            thePool = []
+            cls._pool = thePool
+        return thePool
+
     def __init__ ( self, theSourceID, theDestID, theTime ):
         """
         Parameters
@@ -65,13 +114,52 @@ class EmissionObj:
         self.freqBin = 0
         self.position = None
 
-        # Assign source platform type
-        if type(self) is Packet or type(self) is AckPacket:
-            self.sourceType = 0     # This indicates CommsPlatform
-        elif type(self) is DisruptionToken:
-            self.sourceType = 1     # This indicates DisruptorPlatform
-        else:
-            raise Exception('Unknown emission type.')
+    @classmethod
+    def acquire ( cls, *args ):
+        """
+        Obtain an object of this class, reusing a released object if 
+        one is available.
+
+        Parameters
+        ----------
+        *args
+            The same parameters as the constructor of this class.
+
+        Returns
+        -------
+        theEmissionObj : :class:`EmissionObj`
+            The initialized object.
+        """
+
+        thePool = cls._getPool()
+        if thePool:
+            theEmissionObj = thePool.pop()
+            theEmissionObj.__init__(*args)
+            return theEmissionObj
+        return cls(*args)
+
+    def release ( self ):
+        """
+        Return this object to the pool of its class so that it may be 
+        reused by :meth:`acquire`.
+        If the pool is full, then this object is discarded.
+
+        Warning
+        -------
+        This object must no longer be referenced once released.
+        Method is typically called automatically by the 
+        :class:`.Environment` and is not intended to be called 
+        directly by the user.
+        """
+
+        # Drop references held by this object
+        self.sourceID = None
+        self.destID = None
+        self.position = None
+
+        thePool = type(self)._getPool()
+        if len(thePool) < self._maxPoolSize:
+            thePool.append(self)
 
 
 class Packet(EmissionObj):
@@ -87,6 +175,14 @@ class Packet(EmissionObj):
         The message ID number for this `information unit`.
     """
 
+    __slots__ = ('payload', 'msgID')
+
+    # Emission class
+    KIND = 1
+
+    # Source platform type (this indicates CommsPlatform)
+    sourceType = 0
+
     def __init__ ( self, theSourceID, theDestID, theTime, thePayload, theMsgID ):
         """
         Parameters
@@ -109,6 +205,10 @@ class Packet(EmissionObj):
         self.payload = thePayload
         self.msgID = theMsgID
 
+    def release ( self ):
+        self.payload = None
+        super().release()
+
 
 class AckPacket(Packet):
     """
@@ -121,6 +221,11 @@ class AckPacket(Packet):
     :attr:`~Packet.msgID`, respectively, of the :class:`Packet` that 
     was successfully received.
     """
+
+    __slots__ = ()
+
+    # Emission class
+    KIND = 2
     
     def __init__ ( self, theSourceID, theDestID, theTime, thePayload, theMsgID ):
         # For acknowledgement packets, the payload is the message ID of the Packet that is being acknowledged
@@ -133,6 +238,14 @@ class DisruptionToken(EmissionObj):
     :class:`.DisruptorPlatform` to interfere with a :class:`Packet` 
     and cause it to not be delivered.
     """
+
+    __slots__ = ()
+
+    # Emission class
+    KIND = 3
+
+    # Source platform type (this indicates DisruptorPlatform)
+    sourceType = 1
     
     def __init__ ( self, theSourceID, theDestID, theTime ):
         super().__init__( theSourceID, theDestID, theTime )
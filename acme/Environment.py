@@ -1,7 +1,7 @@
 from .coordinators.CommsCoordinator import CommsCoordinator
 from .platforms.CommsPlatform import CommsPlatform
 from .platforms.DisruptorPlatform import DisruptorPlatform
-import queue
+import collections
 import numpy as np
 
 class Environment:
@@ -30,6 +30,12 @@ class Environment:
         for all platforms in :attr:`disruptorPlatforms`.
     numDisruptorPlatforms : int
         The number of `Disruptor Platforms` (i.e., length of :attr:`disruptorPlatforms`).
+    platformStates : numpy.ndarray
+        The position, velocity, and acceleration of all platforms in 
+        :attr:`commsPlatforms` followed by :attr:`disruptorPlatforms`.
+        Array has shape (:attr:`numCommsPlatforms` + :attr:`numDisruptorPlatforms`, 3, 3), 
+        and the attribute :attr:`.state` of each platform is a view 
+        into this array.
     numFrequencyBins : int
         The number of frequency bins.
     disruptorDelay : int
@@ -45,11 +51,25 @@ class Environment:
         The outer list has length ``len(``:attr:`coordinator` ``) + len(``:attr:`disruptorPlatforms` ``)``.
         Each outer list contains an inner list of length :attr:`numFrequencyBins`.
         Each element of each inner list will contain an :class:`.EmissionObj` or ``None``.
+    emissionGrid : numpy.ndarray
+        The structure-of-arrays form of :attr:`data`, as an ``object`` 
+        array with the same shape as :attr:`data`.
+        Each element contains an :class:`.EmissionObj` or ``None``.
+        Array is read-only after each time step, as it is shared with 
+        the history that `Disruptor Platforms` observe.
+    sourceIdx : numpy.ndarray
+        The index into :attr:`adjMatrix` of the source platform of each 
+        element in :attr:`emissionGrid`, or ``-1`` for empty frequency bins.
+        Array is read-only after each time step, like :attr:`emissionGrid`.
+    sourceType : numpy.ndarray
+        The :attr:`.EmissionObj.sourceType` of each element in 
+        :attr:`emissionGrid`, or ``-1`` for empty frequency bins.
     adjMatrix : numpy.ndarray
         The adjacency matrix denoting one-way active links among 
         `Communications and Disruptor Platforms`.  This matrix is square 
         (but not necessarily symmetric), 
-        with each element of the matrix being ``True`` or ``False``.
+        with each element of the matrix being ``True`` or ``False`` 
+        (stored with data type ``numpy.bool_``).
         Each dimension of the matrix is (:attr:`numCommsPlatforms` + :attr:`numDisruptorPlatforms`).
         If element :math:`(m,n)` in the matrix is ``True``, then:
 
@@ -121,6 +141,8 @@ class Environment:
     the same frequency bins without interfering with each other.
     """
 
+    # Maximum number of resolved destination lists kept for reuse
+    _maxDestCacheSize = 1024
 
     def __init__ ( self, theAdjMatrix, theCommsPlatforms = (), theDisruptorPlatforms = (), theNumFrequencyBins=10, theDisruptorDelay=1, theMediumAccessMethod="rr", theSlidingWindow=0.0 ):
         """
@@ -159,6 +181,14 @@ class Environment:
         # Ensure communications platform IDs are unique
         thePlatformIDs = set(self.commsPlatformIDs)
         assert(len(thePlatformIDs) == len(self.commsPlatforms)), "Communications platform IDs are not unique!"
+        # Map communications platform IDs to their index in commsPlatforms
+        self.__commsIdxByID = {theID: index for index, theID in enumerate(self.commsPlatformIDs)}
+        # Resolved destination indices, keyed by the tuple of destination IDs of an emission object
+        self.__destIdxByDestIDs = {}
+        # Array of communications platform IDs (filled element-wise, so IDs that are sequences are not expanded)
+        self.__commsIDArray = np.empty(len(self.commsPlatformIDs), dtype=object)
+        for index, theID in enumerate(self.commsPlatformIDs):
+            self.__commsIDArray[index] = theID
         # Compute number of communications platforms
         self.numCommsPlatforms = len(self.commsPlatforms)
 
@@ -171,12 +201,23 @@ class Environment:
         # Ensure disruptor platform IDs are unique
         thePlatformIDs = set(self.disruptorPlatformIDs)
         assert(len(thePlatformIDs) == len(self.disruptorPlatforms)), "Disruptor platform IDs are not unique!"
+        # Map disruptor platform IDs to their index in disruptorPlatforms
+        self.__disruptorIdxByID = {theID: index for index, theID in enumerate(self.disruptorPlatformIDs)}
         # Compute number of communications platforms
         self.numDisruptorPlatforms = len(self.disruptorPlatforms)
         
+        # Gather position, velocity, and acceleration of all platforms, so they may be updated at once
+        self.platformStates = np.array([thePlatform.state for thePlatform in self.commsPlatforms + self.disruptorPlatforms], dtype=np.float64).reshape((-1, 3, 3))
+        for pIndex, p in enumerate(self.commsPlatforms + self.disruptorPlatforms):
+            p.state = self.platformStates[pIndex]
+        # Keep the states at the beginning of the simulation, so the Environment may be reset
+        self.__initialPlatformStates = self.platformStates.copy()
+        # Preallocate scratch arrays for the kinematic update
+        self.__kinematicsBuf = (np.empty((len(self.platformStates), 3)), np.empty((len(self.platformStates), 3)))
+
         # Specify the global connectivity/adjacency matrix
         assert(theAdjMatrix.shape == (self.numCommsPlatforms + self.numDisruptorPlatforms, self.numCommsPlatforms + self.numDisruptorPlatforms)), "Size of adjacency matrix must match number of Comms and Disruptor Platforms provided"
-        self.adjMatrix = theAdjMatrix
+        self.adjMatrix = np.ascontiguousarray(theAdjMatrix, dtype=np.bool_)
 
         # Specify the number of discrete frequency bins in the environment
         if theNumFrequencyBins < 1 or type(theNumFrequencyBins) is not int:
@@ -187,35 +228,80 @@ class Environment:
         self.coordinator = [CommsCoordinator(theCommsPlatforms, theNumFrequencyBins, theMediumAccessMethod)]
         # TODO: This is a list to support multiple CommsCoordinators in the future
 
-        # Initialize data for all frequencies
-        self.data = [None] * (len(self.coordinator) + len(self.disruptorPlatforms))
-        for i in range(len(self.coordinator)):
-            self.data[i] = [None] * theNumFrequencyBins
-        for i in range(len(self.disruptorPlatforms)):
-            self.data[i+len(self.coordinator)] = [None] * theNumFrequencyBins
-
         # Specify the delay in number of time steps which the disruptors observe the status of the Environment
         assert(type(theDisruptorDelay) is int and theDisruptorDelay > 0), 'DisruptorDelay is not a positive integer'
         self.disruptorDelay = theDisruptorDelay
-        # Initialize queue for environment status
-        self.__dataQueue = queue.Queue(theDisruptorDelay)
-        # self.__dataQueue.put([self.data, [self.data] * len(self.disruptorPlatforms)])
-        for i in range(theDisruptorDelay):
-            self.__dataQueue.put(self.__copyEnv(self.data))
         
         # Specify the sliding window size (in seconds) for traffic statistics
         assert(type(theSlidingWindow) is float and theSlidingWindow >= 0), 'Sliding window size is not a non-negative floating point number'
         self.windowSize = theSlidingWindow
-        # Initialize traffic statistics matrix
-        self.__trafficTx = [ [ [] for i in range(len(self.commsPlatforms)) ] for j in range(len(self.commsPlatforms)) ]
-        self.__trafficRx = [ [ [] for i in range(len(self.commsPlatforms)) ] for j in range(len(self.commsPlatforms)) ]
+
+        # Initialize the simulation status
+        self.__initStatus()
+
+    def __initStatus ( self ):
+        """
+        Initialize the status of the `Environment` and its traffic 
+        statistics for the beginning of the simulation.
+        """
+
+        # Initialize data for all frequencies
+        self.data = [None] * (len(self.coordinator) + len(self.disruptorPlatforms))
+        for i in range(len(self.coordinator)):
+            self.data[i] = [None] * self.numFrequencyBins
+        for i in range(len(self.disruptorPlatforms)):
+            self.data[i+len(self.coordinator)] = [None] * self.numFrequencyBins
+        # Initialize pool of environment status arrays that may be reused
+        self.__envPool = []
+        # Initialize structure-of-arrays representation of data for all frequencies
+        self.emissionGrid, self.sourceIdx = self.__acquireEnv()
+        self.sourceType = np.full((len(self.data), self.numFrequencyBins), -1, dtype=np.int8)
+
+        # Initialize queue for environment status
+        self.__dataQueue = collections.deque(maxlen=self.disruptorDelay)
+        # Environment status observed by disruptors during the previous time step
+        self.__retiredEnv = None
+        # self.__dataQueue.put([self.data, [self.data] * len(self.disruptorPlatforms)])
+        for i in range(self.disruptorDelay):
+            self.__dataQueue.append(self.__freezeEnv(*self.__acquireEnv()))
+
+        # Initialize traffic statistics matrix (number of packets sent and received between each pair of platforms)
+        self.__txCount = np.zeros((self.numCommsPlatforms, self.numCommsPlatforms), dtype=np.int64)
+        self.__rxCount = np.zeros((self.numCommsPlatforms, self.numCommsPlatforms), dtype=np.int64)
+        # Emission times of counted packets, so they can be removed once outside of the sliding window
+        self.__trafficTx = [ [ collections.deque() for i in range(len(self.commsPlatforms)) ] for j in range(len(self.commsPlatforms)) ]
+        self.__trafficRx = [ [ collections.deque() for i in range(len(self.commsPlatforms)) ] for j in range(len(self.commsPlatforms)) ]
         
+        # Initialize lists of emission objects to be delivered to each communications platform (reused every time step)
+        self.__txData = [list() for i in range(self.numCommsPlatforms)]
+
         # Update platform connectivity according to adjacency matrix
         self.__updatePlatformConnectivity()
 
         # Initialize total elapsed simulation time
         self.elapsedTime = 0
 
+    def reset ( self ):
+        """
+        Return the simulation to its beginning, without constructing the 
+        `Environment` and its platforms again.
+
+        All platforms return to the position, velocity, and acceleration 
+        they had when this `Environment` was constructed, all queued 
+        data is discarded, and the traffic statistics are cleared.
+        The adjacency matrix, frequency bins, delay, and sliding window 
+        are unchanged.
+        """
+
+        for c in self.coordinator:
+            c.reset()
+        for p in self.commsPlatforms:
+            p.reset()
+        for p in self.disruptorPlatforms:
+            p.reset()
+        self.platformStates[...] = self.__initialPlatformStates
+        self.__initStatus()
+
     @property
     def trafficStatistics ( self ):
         """
@@ -237,11 +323,9 @@ class Environment:
             The traffic statistics matrix.
         """
 
-        statMatrix = np.full((self.numCommsPlatforms,self.numCommsPlatforms), 0.0)
-        for sourcePlatformIndex in range(self.numCommsPlatforms):
-            for destPlatformIndex in range(self.numCommsPlatforms):
-                if self.__trafficTx[sourcePlatformIndex][destPlatformIndex]:
-                    statMatrix[sourcePlatformIndex,destPlatformIndex] = len(self.__trafficRx[sourcePlatformIndex][destPlatformIndex]) / len(self.__trafficTx[sourcePlatformIndex][destPlatformIndex])
+        txCount = self.__txCount
+        statMatrix = np.full(txCount.shape, 0.0)
+        np.divide(self.__rxCount, txCount, out=statMatrix, where=txCount > 0)
         return statMatrix
 
     def step ( self, deltaT ):
@@ -264,109 +348,143 @@ class Environment:
             The number of seconds to advance the simulation by.
         """
 
+        # Local references to attributes used throughout this time step
+        numCommsPlatforms = self.numCommsPlatforms
+        numCoordinators = len(self.coordinator)
+        adjMatrix = self.adjMatrix
+        windowSize = self.windowSize
+        trafficTx = self.__trafficTx
+        trafficRx = self.__trafficRx
+        txCount = self.__txCount
+        rxCount = self.__rxCount
+
         # Update position, velocity, and acceleration of all platforms
+        self.__stepKinematics(deltaT)
         for p in self.commsPlatforms:
-            p.step(deltaT)
+            p.advanceTime(deltaT)
         for p in self.disruptorPlatforms:
-            p.step(deltaT)
+            p.advanceTime(deltaT)
         
         # Update platform connectivity according to adjacency matrix
         self.__updatePlatformConnectivity()
         
         # Update elapsed simulation time
         self.elapsedTime += deltaT
+        elapsedTime = self.elapsedTime
 
         # Obtain data for all frequencies from coordinator
         for index, c in enumerate(self.coordinator):
             self.data[index] = c.step()
 
         # Update disruptors with Environment frequency allocation status
-        theEnv = self.__dataQueue.get()
-        # theEnvComm = theEnv[0:len(self.coordinator)]
-        # theEnvDisruptor = theEnv[len(self.coordinator):len(theEnv)]
+        theEmissions, theSourceIdx = self.__dataQueue.popleft()
+        isEmission = theSourceIdx >= 0
         for disruptorIndex, disruptor in enumerate(self.disruptorPlatforms):
-            # Create copy of environment list for this disruptor
-            theEnvTemp = self.__copyEnv(theEnv)
-            # Remove packets from Comms Platforms that this disruptor cannot observe
-            for cIndex in range(len(self.coordinator)):
-                cData = theEnvTemp[cIndex]
-                for packetIndex, packet in enumerate(cData):
-                    if packet is not None:
-                        theSourceID = packet.sourceID
-                        theSourceIndex = self.commsPlatformIDs.index(theSourceID)
-                        if not self.adjMatrix[theSourceIndex, disruptorIndex + self.numCommsPlatforms]:
-                            cData[packetIndex] = None
-            # Remove emission objects from other disruptors that this disruptor cannot observe
-            for dIndex in range(self.numDisruptorPlatforms):
-                dData = theEnvTemp[dIndex + len(self.coordinator)]
-                for emissionIndex, emission in enumerate(dData):
-                    if emission is not None:
-                        theSourceID = emission.sourceID
-                        theSourceIndex = self.disruptorPlatformIDs.index(theSourceID)
-                        if not self.adjMatrix[theSourceIndex + self.numCommsPlatforms, disruptorIndex + self.numCommsPlatforms]:
-                            dData[emissionIndex] = None
+            # Remove emission objects from platforms that this disruptor cannot observe
+            canObserve = adjMatrix[:, disruptorIndex + numCommsPlatforms]
+            if canObserve.all():
+                # Disruptor can observe all platforms, so nothing is removed
+                theEnv = theEmissions.tolist()
+            elif not canObserve.any():
+                # Disruptor cannot observe any platform, so everything is removed
+                theEnv = [[None] * self.numFrequencyBins for row in range(theEmissions.shape[0])]
+            else:
+                # (empty frequency bins have a source index of -1, but are masked out)
+                isObservable = isEmission & canObserve[theSourceIdx]
+                theEnv = np.where(isObservable, theEmissions, None).tolist()
             # Update this disruptor's view of the Environment
-            disruptor.env = theEnvTemp
+            disruptor.env = theEnv
+        # Emissions observed by disruptors during the previous time step are no longer referenced and may be reused
+        if self.__retiredEnv is not None:
+            theRetiredEmissions, theRetiredSourceIdx = self.__retiredEnv
+            for emissionObj in theRetiredEmissions[theRetiredSourceIdx >= 0]:
+                emissionObj.release()
+            # Environment status arrays are no longer needed and may be reused
+            self.__envPool.append(self.__retiredEnv)
+        self.__retiredEnv = (theEmissions, theSourceIdx)
 
         # Obtain disruptions from all disruptor platforms
         for pIndex, p in enumerate(self.disruptorPlatforms):
-            self.data[pIndex + len(self.coordinator)] = p.getDisruptions()
+            self.data[pIndex + numCoordinators] = p.getDisruptions()
+
+        # Update structure-of-arrays representation of the frequency bins
+        self.__updateEmissionGrid()
 
         # Add actions from CommsCoordinator and Disruptors to history queue
-        self.__dataQueue.put(self.__copyEnv(self.data))
-        assert(self.__dataQueue.full()), "Environment history queue should always be full!"
+        self.__dataQueue.append(self.__freezeEnv(self.emissionGrid, self.sourceIdx))
+        assert(len(self.__dataQueue) == self.disruptorDelay), "Environment history queue should always be full!"
         
         # Send data to each communication platform
-        txData = [list() for i in range(self.numCommsPlatforms)]
-        for platformData in self.data:
-            for emissionObj in platformData:
-                if emissionObj is not None:
-                    # Record time emission object was transmitted into the Environment
-                    emissionObj.emissionTime = self.elapsedTime
-                
-                    for destID in emissionObj.destID:
-                        try:
-                            destPlatformIndex = self.commsPlatformIDs.index(destID)
-                            if emissionObj.sourceType == 0:
-                                sourcePlatformIndex = self.commsPlatformIDs.index(emissionObj.sourceID)
-                                # Add packet to matrix keeping track of all traffic
-                                self.__trafficTx[sourcePlatformIndex][destPlatformIndex].append(emissionObj)
-                            elif emissionObj.sourceType == 1:
-                                sourcePlatformIndex = self.disruptorPlatformIDs.index(emissionObj.sourceID) + self.numCommsPlatforms
-                            if self.adjMatrix[sourcePlatformIndex,destPlatformIndex]:
-                                txData[destPlatformIndex].append(emissionObj)
-                        except:
-                            pass
+        theEmissions, pairEmission, pairDest = self.__flattenEmissions()
+        isEmission = self.sourceIdx >= 0
+        pairSource = self.sourceIdx[isEmission][pairEmission]
+        pairType = self.sourceType[isEmission][pairEmission]
+        # Add packets to matrix keeping track of all traffic
+        isPacket = pairType == 0
+        np.add.at(txCount, (pairSource[isPacket], pairDest[isPacket]), 1)
+        if windowSize > 0:
+            for pairIndex in np.nonzero(isPacket)[0]:
+                trafficTx[pairSource[pairIndex]][pairDest[pairIndex]].append(elapsedTime)
+        # Deliver emission objects only over active links
+        isDelivered = adjMatrix[pairSource, pairDest]
+        txData = self.__txData
+        for pairIndex in np.nonzero(isDelivered)[0]:
+            txData[pairDest[pairIndex]].append(theEmissions[pairEmission[pairIndex]])
         for index, commPlatform in enumerate(self.commsPlatforms):
             commPlatform.putData(txData[index])
+            txData[index].clear()
         
         # Update traffic statistics
-        for destPlatformIndex in range(self.numCommsPlatforms):
-            isDisrupted = False
-            for emissionObj in txData[destPlatformIndex]:
-                if emissionObj.sourceType == 1:
-                    isDisrupted = True
-            for emissionObj in txData[destPlatformIndex]:
-                if emissionObj.sourceType == 0:
-                    sourcePlatformIndex = self.commsPlatformIDs.index(emissionObj.sourceID)
-                    if not isDisrupted:
-                        # Add packet to matrix keeping track of traffic that is successfully transmitted and received
-                        self.__trafficRx[sourcePlatformIndex][destPlatformIndex].append(emissionObj)
+        # Indicate which platforms receive a disruption token
+        isDisrupted = np.zeros(numCommsPlatforms, dtype=bool)
+        isDisrupted[pairDest[isDelivered & (pairType == 1)]] = True
+        # Add packets to matrix keeping track of traffic that is successfully transmitted and received
+        isReceived = isDelivered & isPacket & ~isDisrupted[pairDest]
+        np.add.at(rxCount, (pairSource[isReceived], pairDest[isReceived]), 1)
+        if windowSize > 0:
+            for pairIndex in np.nonzero(isReceived)[0]:
+                trafficRx[pairSource[pairIndex]][pairDest[pairIndex]].append(elapsedTime)
         
         # Remove traffic statistics outside of sliding window
-        if self.windowSize > 0:
-            for sourcePlatformIndex in range(self.numCommsPlatforms):
-                for destPlatformIndex in range(self.numCommsPlatforms):
-                    if self.__trafficTx[sourcePlatformIndex][destPlatformIndex]:
-                        while self.elapsedTime - self.__trafficTx[sourcePlatformIndex][destPlatformIndex][0].emissionTime > self.windowSize:
-                            self.__trafficTx[sourcePlatformIndex][destPlatformIndex].pop(0)
-                            if len(self.__trafficTx[sourcePlatformIndex][destPlatformIndex]) is 0:
-                                break
-                    if self.__trafficRx[sourcePlatformIndex][destPlatformIndex]:
-                        while self.elapsedTime - self.__trafficRx[sourcePlatformIndex][destPlatformIndex][0].emissionTime > self.windowSize:
-                            self.__trafficRx[sourcePlatformIndex][destPlatformIndex].pop(0)
-                            if len(self.__trafficRx[sourcePlatformIndex][destPlatformIndex]) is 0:
-                                break
+        if windowSize > 0:
+            for sourcePlatformIndex in range(numCommsPlatforms):
+                for destPlatformIndex in range(numCommsPlatforms):
+                    theTraffic = trafficTx[sourcePlatformIndex][destPlatformIndex]
+                    while theTraffic and elapsedTime - theTraffic[0] > windowSize:
+                        theTraffic.popleft()
+                        txCount[sourcePlatformIndex, destPlatformIndex] -= 1
+                    theTraffic = trafficRx[sourcePlatformIndex][destPlatformIndex]
+                    while theTraffic and elapsedTime - theTraffic[0] > windowSize:
+                        theTraffic.popleft()
+                        rxCount[sourcePlatformIndex, destPlatformIndex] -= 1
+
+    def stepMany ( self, numSteps, deltaT, observer=None ):
+        """
+        Advance the simulation by ``numSteps`` time steps of ``deltaT`` 
+        seconds each (i.e., call :meth:`step` ``numSteps`` times).
+
+        Parameters
+        ----------
+        numSteps : int
+            The number of time steps to advance the simulation by.
+        deltaT : float
+            The number of seconds to advance the simulation by in each 
+            time step.
+        observer : callable
+            Function called after each time step as ``observer(t, env)``, 
+            where ``t`` is the index of the time step just completed 
+            (starting at 0) and ``env`` is this `Environment` 
+            (default None).
+        """
+
+        step = self.step
+        if observer is None:
+            for t in range(numSteps):
+                step(deltaT)
+        else:
+            for t in range(numSteps):
+                step(deltaT)
+                observer(t, self)
 
 
     def __updatePlatformConnectivity ( self ):
@@ -379,57 +497,140 @@ class Environment:
 
         # Update platform connectivity according to adjacency matrix
         for pIndex, p in enumerate(self.commsPlatforms):
-            # Get platform list indices
-            destIndices = list(np.nonzero(self.adjMatrix[pIndex, 0:self.numCommsPlatforms])[0])
-            # Convert from list index to ID
-            p.destIDs = self.__indexToID(destIndices)
+            p.destIDs = self.__commsIDArray[np.nonzero(self.adjMatrix[pIndex, 0:self.numCommsPlatforms])[0]].tolist()
         for pIndex, p in enumerate(self.disruptorPlatforms):
-            # Get platform list indices
-            destIndices = list(np.nonzero(self.adjMatrix[pIndex + self.numCommsPlatforms, 0:self.numCommsPlatforms])[0])
-            # Convert from list index to ID
-            p.commsDestIDs = self.__indexToID(destIndices)
-    
-    def __indexToID ( self, indices ):
+            p.commsDestIDs = self.__commsIDArray[np.nonzero(self.adjMatrix[pIndex + self.numCommsPlatforms, 0:self.numCommsPlatforms])[0]].tolist()
+
+    def __updateEmissionGrid ( self ):
+        """
+        Update :attr:`emissionGrid`, :attr:`sourceIdx`, and 
+        :attr:`sourceType` according to the current values in :attr:`data`.
         """
-        Convert integer index into :attr:`commsPlatforms` to their 
-        corresponding identification attributes :attr:`.id`.
+
+        self.emissionGrid, self.sourceIdx = self.__acquireEnv()
+        for rowIndex, rowData in enumerate(self.data):
+            self.emissionGrid[rowIndex, :] = rowData
+            for binIndex, emissionObj in enumerate(rowData):
+                if emissionObj is None:
+                    self.sourceIdx[rowIndex, binIndex] = -1
+                    self.sourceType[rowIndex, binIndex] = -1
+                else:
+                    if emissionObj.sourceType == 0:
+                        self.sourceIdx[rowIndex, binIndex] = self.__commsIdxByID[emissionObj.sourceID]
+                    elif emissionObj.sourceType == 1:
+                        self.sourceIdx[rowIndex, binIndex] = self.__disruptorIdxByID[emissionObj.sourceID] + self.numCommsPlatforms
+                    else:
+                        raise ValueError("Unknown emission type.")
+                    self.sourceType[rowIndex, binIndex] = emissionObj.sourceType
+
+    def __flattenEmissions ( self ):
+        """
+        Flatten all emission objects in :attr:`emissionGrid` and their 
+        destinations into (emission, destination) pairs.
+        Also records the time each emission object was transmitted into 
+        the `Environment`.
+
+        Returns
+        -------
+        theEmissions : list of :class:`.EmissionObj`
+            The emission objects in :attr:`emissionGrid`, in row-major order.
+        pairEmission : numpy.ndarray
+            The index into ``theEmissions`` for each pair.
+        pairDest : numpy.ndarray
+            The index into :attr:`commsPlatforms` of the destination for 
+            each pair.  Destinations that are not known 
+            `Communications Platforms` are omitted.
+        """
+
+        theEmissions = self.emissionGrid[self.sourceIdx >= 0].tolist()
+        theDestIdx = [None] * len(theEmissions)
+        commsIdxByID = self.__commsIdxByID
+        destIdxByDestIDs = self.__destIdxByDestIDs
+        for emissionIndex, emissionObj in enumerate(theEmissions):
+            # Record time emission object was transmitted into the Environment
+            emissionObj.emissionTime = self.elapsedTime
+
+            # Platforms emit to the same destinations repeatedly, so each list of destinations is resolved only once
+            theDestIDs = tuple(emissionObj.destID)
+            destIdx = destIdxByDestIDs.get(theDestIDs)
+            if destIdx is None:
+                if len(destIdxByDestIDs) >= self._maxDestCacheSize:
+                    destIdxByDestIDs.clear()
+                # Destinations that are not known Comms Platforms are omitted, so emission is not delivered to them
+                destIdx = np.array([commsIdxByID[destID] for destID in theDestIDs if destID in commsIdxByID], dtype=np.intp)
+                destIdxByDestIDs[theDestIDs] = destIdx
+            theDestIdx[emissionIndex] = destIdx
+        if not theEmissions:
+            return theEmissions, np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+        pairEmission = np.repeat(np.arange(len(theEmissions)), [len(destIdx) for destIdx in theDestIdx])
+        pairDest = np.concatenate(theDestIdx)
+        return theEmissions, pairEmission, pairDest
+
+    def __stepKinematics ( self, deltaT ):
+        """
+        Advance the position and velocity of all platforms in 
+        :attr:`platformStates` by ``deltaT`` seconds, in place and 
+        without allocating temporary arrays (acceleration is constant).
 
         Parameters
         ----------
-        indices : list of int
-            The list of integer indices.
+        deltaT : float
+            The number of seconds to advance the platforms by.
+        """
+
+        pos = self.platformStates[:, 0]
+        vel = self.platformStates[:, 1]
+        acc = self.platformStates[:, 2]
+        velTerm, accTerm = self.__kinematicsBuf
+
+        np.multiply(vel, deltaT, out=velTerm)
+        np.multiply(acc, 0.5*deltaT*deltaT, out=accTerm)
+        velTerm += accTerm
+        pos += velTerm
+        np.multiply(acc, deltaT, out=accTerm)
+        vel += accTerm
+
+    def __acquireEnv ( self ):
+        """
+        Obtain writable arrays for the structure-of-arrays environment 
+        status, reusing arrays from previous time steps that are no 
+        longer needed when available.
+        Reused arrays are not cleared.
 
         Returns
         -------
-        IDs : list
-            The list of corresponding IDs.
+        theEmissions : numpy.ndarray
+            The array in the form of :attr:`emissionGrid`.
+        theSourceIdx : numpy.ndarray
+            The array in the form of :attr:`sourceIdx`.
         """
 
-        IDs = [None] * len(indices)
-        for idx in range(len(indices)):
-            IDs[idx] = self.commsPlatformIDs[indices[idx]]
-            # IDs[idx] = self.platforms[indices[idx]].id
-        return IDs
+        if not self.__envPool:
+            return np.full((len(self.data), self.numFrequencyBins), None, dtype=object), np.full((len(self.data), self.numFrequencyBins), -1, dtype=np.int32)
+        theEmissions, theSourceIdx = self.__envPool.pop()
+        theEmissions.flags.writeable = True
+        theSourceIdx.flags.writeable = True
+        return theEmissions, theSourceIdx
 
-    def __copyEnv ( self, theEnv ):
+    def __freezeEnv ( self, theEmissions, theSourceIdx ):
         """
-        Make recursive copy of the environment status.
-        Emission objects themselves are not copied.
+        Make the structure-of-arrays environment status read-only, so it 
+        can be placed in the history queue without being copied.
+        Emission objects themselves are not affected.
 
         Parameters
         ----------
-        theEnv : list of list
-            The environment status, in the same form as :attr:`data`.
-        
+        theEmissions : numpy.ndarray
+            The array in the form of :attr:`emissionGrid`.
+        theSourceIdx : numpy.ndarray
+            The array in the form of :attr:`sourceIdx`.
+
         Returns
         -------
-        theEnvCopy : list of list
-            The copy of the environment status.
+        theEnv : tuple of numpy.ndarray
+            The read-only ``(theEmissions, theSourceIdx)``.
         """
 
-        # Make copy of top-level list
-        theEnvCopy = theEnv.copy()
-        # Make copy of second-level list
-        for index, item in enumerate(theEnv):
-            theEnvCopy[index] = item.copy()
-        return theEnvCopy
+        theEmissions.flags.writeable = False
+        theSourceIdx.flags.writeable = False
+        return theEmissions, theSourceIdx
@@ -72,10 +72,22 @@ class CommsCoordinator:
         self.numFrequencyBins = theNumFrequencyBins
         
         # Specify the medium access control method
+        macSteps = {"rr": self.__stepRoundRobin, "tdma": self.__stepTDMA, "fdma": self.__stepFDMA}
+        if theMediumAccessMethod not in macSteps:
+            raise ValueError("Invalid medium access control method")
         self.mac = theMediumAccessMethod
+        self.__stepMAC = macSteps[theMediumAccessMethod]
+
+        # When using TDMA, only one frequency bin may exist
+        if theMediumAccessMethod == "tdma" and theNumFrequencyBins != 1:
+            raise ValueError("When using TDMA, only one frequency bin can exist.")
         
         # Initialize TDMA index
-        self.__TDMAindex = 0
+        self._tdmaIndex = 0
+
+        # Preallocate the lists of packets returned by the MAC steppers
+        self._txBuf = [None] * theNumFrequencyBins
+        self._tdmaBuf = [None]
 
     
     def step ( self ):
@@ -92,6 +104,7 @@ class CommsCoordinator:
             Each element of the list is either ``None`` or contains a 
             single :class:`.Packet`.
             List has length :attr:`numFrequencyBins`.
+            The same list is reused (and overwritten) every time step.
         
         Warning
         -------
@@ -100,27 +113,25 @@ class CommsCoordinator:
         the user.
         """
 
-        if self.mac == "rr":
-            txPackets = self.__stepRoundRobin()
-        elif self.mac == "tdma":
-            txPackets = self.__stepTDMA()
-        elif self.mac == "fdma":
-            txPackets = self.__stepFDMA()
-        else:
-            raise ValueError("Invalid medium access control method")
+        # Packets are assigned their frequency bin index and position as they are placed
+        return self.__stepMAC()
+    
 
-        # Assign position and frequency bin index to each packet
-        for binIndex, packet in enumerate(txPackets):
-            # Assign frequency bin index
-            if packet:
-                packet.freqBin = binIndex
-                # Get platform index
-                platformIndex = self.platformIDs.index(packet.sourceID)
-                # Assign emission/platform position
-                packet.position = self.platforms[platformIndex].pos
+    def reset ( self ):
+        """
+        Return the Coordinator to the beginning of the simulation.
+
+        Warning
+        -------
+        This method is typically called automatically by the 
+        :class:`.Environment` and is generally not called directly by 
+        the user.
+        """
+
+        self._tdmaIndex = 0
+        self._txBuf[:] = (None,) * len(self._txBuf)
+        self._tdmaBuf[0] = None
 
-        return txPackets
-    
 
     def __stepRoundRobin ( self ):
         """
@@ -132,12 +143,14 @@ class CommsCoordinator:
         """
 
         # Frequency bins are filled only as platforms actually have data to transmit
-        txPackets = [None] * self.numFrequencyBins
+        txPackets = self._txBuf
+        txPackets[:] = (None,) * len(txPackets)
+        annotate = self.__annotate
         index = 0
         for p in self.platforms:
             theData = p.getData()
             if theData:
-                txPackets[index] = theData
+                txPackets[index] = annotate(theData, index, p)
                 index += 1
             if index == self.numFrequencyBins:
                 # There are more platforms with data to transmit than there are frequency bins
@@ -156,18 +169,12 @@ class CommsCoordinator:
         """
 
         # Only one platform can transmit at a time
-
-        # Only one frequency bin may exist
-        if self.numFrequencyBins != 1:
-            raise ValueError("When using TDMA, only one frequency bin can exist.")
-
-        p = self.platforms[self.__TDMAindex]
-        txPackets = [p.getData()]
+        p = self.platforms[self._tdmaIndex]
+        txPackets = self._tdmaBuf
+        txPackets[0] = self.__annotate(p.getData(), 0, p)
 
         # Increment TDMA index to next platform
-        self.__TDMAindex += 1
-        if self.__TDMAindex == self.numPlatforms:
-            self.__TDMAindex = 0        
+        self._tdmaIndex = (self._tdmaIndex + 1) % self.numPlatforms
 
         return txPackets
 
@@ -187,7 +194,35 @@ class CommsCoordinator:
         if self.numFrequencyBins < self.numPlatforms:
             raise ValueError("When using FDMA, the number of frequency bins must be at least the number of platforms.")
 
-        txPackets = [None] * self.numFrequencyBins
-        for index, p in enumerate(self.platforms):
-            txPackets[index] = p.getData()
+        # Frequency bins beyond the number of platforms are never filled and remain None
+        txPackets = self._txBuf
+        annotate = self.__annotate
+        txPackets[:self.numPlatforms] = [annotate(p.getData(), index, p) for index, p in enumerate(self.platforms)]
         return txPackets
+
+
+    def __annotate ( self, thePacket, theBinIndex, thePlatform ):
+        """
+        Assign the frequency bin index and emission position to a 
+        packet being placed in a frequency bin.
+
+        Parameters
+        ----------
+        thePacket : :class:`.Packet`
+            The :class:`.Packet` to annotate, or ``None``.
+        theBinIndex : int
+            The frequency bin index in which the packet is placed.
+        thePlatform : :class:`.CommsPlatform`
+            The `Communications Platform` transmitting the packet.
+
+        Returns
+        -------
+        thePacket : :class:`.Packet`
+            The annotated :class:`.Packet`, or ``None``.
+        """
+
+        if thePacket:
+            # Assign frequency bin index and emission/platform position
+            thePacket.freqBin = theBinIndex
+            thePacket.position = thePlatform.pos     # pos is a copy, so is not changed by later time steps
+        return thePacket
@@ -2,10 +2,38 @@ from .Platform import Platform
 from ..EmissionObj import Packet
 from ..EmissionObj import AckPacket
 from ..EmissionObj import DisruptionToken
-import queue
+import numpy as np
+import collections
+import itertools
 import warnings
 import copy
 
+# Payload types that are immutable, and therefore do not need to be copied
+_IMMUTABLE_TYPES = (bool, int, float, complex, str, bytes, type(None))
+
+def _copyPayload ( thePayload ):
+    """
+    Make deep-copy of a payload, unless the payload is immutable.
+
+    Parameters
+    ----------
+    thePayload : any
+        The user data payload.
+
+    Returns
+    -------
+    thePayloadCopy : any
+        ``thePayload`` itself if it is immutable, or else a deep-copy 
+        of ``thePayload``.
+    """
+
+    # Exact type checks, as subclasses of immutable types may carry mutable state
+    if type(thePayload) in _IMMUTABLE_TYPES:
+        return thePayload
+    if type(thePayload) in (tuple, frozenset) and all(type(item) in _IMMUTABLE_TYPES for item in thePayload):
+        return thePayload
+    return copy.deepcopy(thePayload)
+
 class CommsPlatform(Platform):
     """
     Models a `Communications Platform` that can transmit and receive 
@@ -13,9 +41,11 @@ class CommsPlatform(Platform):
 
     Attributes
     ----------
-    destIDs : list
-        The list of identification attributes :attr:`.id` for all 
-        platforms that this platform may transmit to.
+    destIDs : tuple
+        The identification attributes :attr:`.id` for all platforms 
+        that this platform may transmit to.
+        May be assigned a list or tuple, and is stored as a read-only 
+        tuple.
     doAck : boolean
         Indication whether to place acknowledgement packets into the 
         transmit queue when data packets are received and placed into 
@@ -28,6 +58,8 @@ class CommsPlatform(Platform):
     Currently, this value is populated with ground-truth values from :attr:`.Environment.adjMatrix`.
     """
     
+    __slots__ = ('_destIDs', 'txQueue', 'rxQueue', 'doAck', '_maxQueueSize', '_msgIDCounter', '_rxFullMsg', '_txFullMsg')
+
     def __init__ ( self, theID, theMaxSize=100, theDoAck = True, initialPos=[0,0,0], initialVel=[0,0,0], initialAcc=[0,0,0] ):
         """
         Parameters
@@ -60,32 +92,36 @@ class CommsPlatform(Platform):
         super().__init__( theID, initialPos, initialVel, initialAcc )
 
         # Initialize array of destination IDs
-        self.destIDs = []
+        self.destIDs = ()
 
         # Initialize FIFO data buffer/queue
         if theMaxSize < 1:
             raise ValueError("Maximum transmit queue size must be greater than zero.")
-        self.txQueue = queue.Queue(theMaxSize)
-        self.rxQueue = queue.Queue(theMaxSize)
+        self._maxQueueSize = theMaxSize
+        self.txQueue = collections.deque()
+        self.rxQueue = collections.deque()
+        # Precompute warnings issued when data is dropped from a full queue
+        self._rxFullMsg = "Receive queue for PlatformID {} is full.  Data is dropped.".format(theID)
+        self._txFullMsg = "Transmit queue for PlatformID {} is full.  Data is dropped.".format(theID)
 
         # Specify if node should create acknowledgement packets when data packets are received
         self.doAck = theDoAck
 
-        # Initialize message ID value
-        self.__currentMsgID = 1
+        # Initialize message ID counter
+        self._msgIDCounter = itertools.count(1)
 
     @property
     # Specify array of destination IDs that this object can transmit to
     def destIDs(self):
-        return self.__destIDs
+        return self._destIDs
     @destIDs.setter
     def destIDs(self, value):
-        if type(value) is not list:
-            raise ValueError("Node IDs must be specified as a list of values.")
+        if type(value) not in (list, tuple):
+            raise ValueError("Node IDs must be specified as a list or tuple of values.")
         #for i in value:
         #    if type(i) is not int:
         #        raise ValueError("Node IDs must be specified as a list of integers.")
-        self.__destIDs = value
+        self._destIDs = tuple(value)
 
     
     def txData ( self, thePayload, theDestID ):
@@ -121,9 +157,52 @@ class CommsPlatform(Platform):
         # Create packet to transmit
         theMsgID = self.__getNextMsgID()
         # Make deep-copy of payload
-        thePayloadCopy = copy.deepcopy(thePayload)
-        thePacket = Packet(self.id, theDestID, self.elapsedTime, thePayloadCopy, theMsgID)
+        thePayloadCopy = _copyPayload(thePayload)
+        thePacket = Packet.acquire(self.id, theDestID, self.elapsedTime, thePayloadCopy, theMsgID)
         self.__txPacket(thePacket)
+
+    def txDataBulk ( self, thePayloads, theDestID ):
+        """
+        Send multiple data (information units) to the same 
+        destinations, with one :class:`.Packet` per payload.
+        Equivalent to calling :meth:`txData` for each payload in order, 
+        except that at most one warning is issued if the transmit queue 
+        becomes full.
+
+        Parameters
+        ----------
+        thePayloads : iterable or numpy.ndarray
+            The user data, each to become the :attr:`.payload` of a 
+            :class:`.Packet` to be transmitted.
+            If a numpy.ndarray, then each element along the first axis 
+            is converted to Python objects (via ``tolist``).
+        theDestID : list
+            The list of identification attributes :attr:`.id` for all 
+            platforms the payloads are to be transmitted to.
+        """
+
+        # To be called by the user to transmit data
+
+        # Error checking
+        assert(type(theDestID) is list), 'theDestIDs is not a list'
+
+        if isinstance(thePayloads, np.ndarray):
+            thePayloads = thePayloads.tolist()
+
+        txQueue = self.txQueue
+        maxQueueSize = self._maxQueueSize
+        acquirePacket = Packet.acquire
+        msgIDCounter = self._msgIDCounter
+        isDropped = False
+        for thePayload in thePayloads:
+            # Message IDs are consumed even when data is dropped, as in txData
+            theMsgID = next(msgIDCounter)
+            if len(txQueue) >= maxQueueSize:
+                isDropped = True
+                continue
+            txQueue.append(acquirePacket(self.id, theDestID, self.elapsedTime, _copyPayload(thePayload), theMsgID))
+        if isDropped:
+            warnings.warn(self._txFullMsg)
     
     def rxData ( self ):
         """
@@ -147,12 +226,12 @@ class CommsPlatform(Platform):
         """
 
         # To be called by the user to query for data that has been received
-        if self.rxQueue.empty():
+        if not self.rxQueue:
             thePayloadTemp = None
         else:
-            thePayloadTemp = self.rxQueue.get()
+            thePayloadTemp = self.rxQueue.popleft()
         # Make deep-copy of payload
-        thePayload = copy.deepcopy(thePayloadTemp)
+        thePayload = _copyPayload(thePayloadTemp)
         return thePayload
     
     def getData ( self ):
@@ -174,12 +253,39 @@ class CommsPlatform(Platform):
 
         # To be called by the CommsCoordinator each time step
         # Get data to transmit
-        if self.txQueue.empty():
+        if not self.txQueue:
             thePacket = None
         else:
-            thePacket = self.txQueue.get()
+            thePacket = self.txQueue.popleft()
         return thePacket
 
+    def getDataBatch ( self, n ):
+        """
+        Obtain up to the next ``n`` :class:`.Packet` in the transmit 
+        queue to be transmitted.
+
+        Parameters
+        ----------
+        n : int
+            The maximum number of :class:`.Packet` to obtain.
+
+        Returns
+        -------
+        thePackets : list of :class:`.Packet`
+            The :class:`.Packet` to be transmitted, in the order they 
+            were queued.
+            List is empty when the transmit queue is empty.
+
+        Warning
+        -------
+        Method is intended to be called by a :class:`.CommsCoordinator` 
+        and is not intended to be called directly by the user.
+        """
+
+        txQueue = self.txQueue
+        popleft = txQueue.popleft
+        return [popleft() for _ in range(min(n, len(txQueue)))]
+
     def putData ( self, theEmissionList ):
         """
         Process `emission objects` that have been received and place 
@@ -205,31 +311,52 @@ class CommsPlatform(Platform):
 
         # To be called by the Environment each time step
         
-        # Determine if packets should be dropped due to disruptions
-        isDisrupted = False
-        for thePacket in theEmissionList:
-            if isinstance(thePacket, DisruptionToken):
-                isDisrupted = True
-        if isDisrupted:
-            return
-
+        # Gather received packets, dropping all of them if any disruption is present
+        theReceivedPackets = []
         for thePacket in theEmissionList:
+            theKind = thePacket.KIND
+            if theKind == DisruptionToken.KIND:
+                return
             # Drop acknowledgement packets
-            if isinstance(thePacket, AckPacket):
-                continue
+            if theKind != AckPacket.KIND:
+                theReceivedPackets.append(thePacket)
 
+        # Warn at most once per call for each full queue
+        isRxWarned = False
+        isTxWarned = False
+        for thePacket in theReceivedPackets:
             # Add packet to receive queue
-            if self.rxQueue.full():
-                warnings.warn("Receive queue for PlatformID {} is full.  Data is dropped.".format(self.id))
+            if len(self.rxQueue) >= self._maxQueueSize:
+                if not isRxWarned:
+                    warnings.warn(self._rxFullMsg)
+                    isRxWarned = True
             else:
-                self.rxQueue.put(thePacket.payload)
+                self.rxQueue.append(thePacket.payload)
                 if self.doAck:
                     #assert(thePacket.sourceID in self.destIDs), "Communication is not bi-directional. Cannot send acknowledgements."
                     theMsgID = self.__getNextMsgID()
-                    theAckPacket = AckPacket(self.id, [thePacket.sourceID], self.elapsedTime, thePacket.msgID, theMsgID)
-                    self.__txPacket(theAckPacket)
+                    theAckPacket = AckPacket.acquire(self.id, [thePacket.sourceID], self.elapsedTime, thePacket.msgID, theMsgID)
+                    if not self.__txPacket(theAckPacket, not isTxWarned):
+                        isTxWarned = True
 
-    def __txPacket ( self, thePacket ):
+    def reset ( self ):
+        """
+        Return the platform to the beginning of the simulation, 
+        discarding all queued data and restarting message IDs.
+
+        Warning
+        -------
+        Method is typically called automatically by the 
+        :class:`.Environment` and is not intended to be called 
+        directly by the user.
+        """
+
+        super().reset()
+        self.txQueue.clear()
+        self.rxQueue.clear()
+        self._msgIDCounter = itertools.count(1)
+
+    def __txPacket ( self, thePacket, doWarn=True ):
         """
         Add packet to transmit queue.
 
@@ -237,12 +364,23 @@ class CommsPlatform(Platform):
         ----------
         thePacket : :class:`.Packet`
             The :class:`.Packet` to add to the platform's transmit queue.
+        doWarn : boolean
+            Indication whether to issue a warning if the packet is 
+            dropped because the transmit queue is full.
+
+        Returns
+        -------
+        isQueued : boolean
+            Indication whether the packet was placed in the transmit queue.
         """
 
-        if self.txQueue.full():
-            warnings.warn("Transmit queue for PlatformID {} is full.  Data is dropped.".format(self.id))
-        else:
-            self.txQueue.put(thePacket)
+        if len(self.txQueue) >= self._maxQueueSize:
+            if doWarn:
+                warnings.warn(self._txFullMsg)
+            thePacket.release()
+            return False
+        self.txQueue.append(thePacket)
+        return True
 
     def __getNextMsgID ( self ):
         """
@@ -254,6 +392,4 @@ class CommsPlatform(Platform):
             The next unique message ID
         """
 
-        theMsgID = self.__currentMsgID
-        self.__currentMsgID += 1
-        return theMsgID
+        return next(self._msgIDCounter)
@@ -2,6 +2,10 @@ from .Platform import Platform
 from ..EmissionObj import DisruptionToken
 import random
 
+# Bind random placement functions once, avoiding module attribute lookups every time step
+_randrange = random.randrange
+_sample = random.sample
+
 class DisruptorPlatform(Platform):
     """
     Models a `Disruptor Platform` that can transmit `disruption tokens` 
@@ -20,15 +24,22 @@ class DisruptorPlatform(Platform):
     numTokensRemaining : int
         The number of :class:`.DisruptionToken` remaining available to 
         be transmitted in the current time epoch.
-    commsDestIDs : list
-        The list of identification attributes :attr:`.id` for all 
+    commsDestIDs : tuple
+        The identification attributes :attr:`.id` for all 
         :class:`.CommsPlatform` that this platform may interfere with.
+        May be assigned a list or tuple, and is stored as a read-only 
+        tuple.
     env : list of lists
         This platform's current view and observation of the 
         :class:`.Environment`.
         Has same format as :attr:`.Environment.data`.
+        The emission objects in this view are only valid until the 
+        next time step, after which they may be reused by the 
+        :class:`.Environment`.
     """
     
+    __slots__ = ('numMaxTokens', 'numFrequencyBins', 'numTimeStepsPerEpoch', 'numTokensRemaining', '_commsDestIDs', 'env', '_tokBuf', '_binRange')
+
     def __init__ ( self, theID, theNumMaxTokens=10, theNumFrequencyBins=10, theNumTimeStepsPerEpoch=10, initialPos=[0,0,0], initialVel=[0,0,0], initialAcc=[0,0,0] ):
         """
         Parameters
@@ -74,26 +85,30 @@ class DisruptorPlatform(Platform):
         self.numTokensRemaining = theNumMaxTokens
 
         # Initialize array of destination IDs
-        self.commsDestIDs = []
+        self.commsDestIDs = ()
         
         # Initialize current observation of Environment
         # Will be directly updated by Environment, and will be a list of [[CommsCoordinator data], [[Disruptor1 data], [Disruptor2 data], ...]]
         self.env = None
 
+        # Preallocate the list of tokens returned by getDisruptions
+        self._tokBuf = [None] * theNumFrequencyBins
+        self._binRange = range(theNumFrequencyBins)
+
     @property
     # Specify array of destination IDs that this object can transmit to
     def commsDestIDs(self):
-        return self.__commsDestIDs
+        return self._commsDestIDs
     @commsDestIDs.setter
     def commsDestIDs(self, value):
-        if type(value) is not list:
-            raise ValueError("Node IDs must be specified as a list of values.")
-        self.__commsDestIDs = value
+        if type(value) not in (list, tuple):
+            raise ValueError("Node IDs must be specified as a list or tuple of values.")
+        self._commsDestIDs = tuple(value)
     
-    def step ( self, deltaT ):
+    def advanceTime ( self, deltaT ):
         """
-        Advance the platform's position, velocity, and acceleration by 
-        ``deltaT`` seconds.
+        Advance the platform's elapsed time by ``deltaT`` seconds and 
+        onto the next time step.
         Reset the number of `disruption tokens` available if a new 
         time epoch has been reached.
         
@@ -103,7 +118,7 @@ class DisruptorPlatform(Platform):
             The number of seconds to advance the platform by.
         """
 
-        super().step(deltaT)
+        super().advanceTime(deltaT)
 
         # Determine if a new time epoch has begun
         if self.elapsedTimeSteps % self.numTimeStepsPerEpoch == 0:
@@ -111,6 +126,23 @@ class DisruptorPlatform(Platform):
             self.numTokensRemaining = self.numMaxTokens
         
 
+    def reset ( self ):
+        """
+        Return the platform to the beginning of the simulation, with 
+        all `disruption tokens` available and no observation of the 
+        :class:`.Environment`.
+
+        Warning
+        -------
+        Method is typically called automatically by the 
+        :class:`.Environment` and is not intended to be called 
+        directly by the user.
+        """
+
+        super().reset()
+        self.numTokensRemaining = self.numMaxTokens
+        self.env = None
+
     def getDisruptions ( self ):
         """
         Decide which `disruption tokens` should be placed in which 
@@ -124,6 +156,7 @@ class DisruptorPlatform(Platform):
             Each element of the list is either ``None`` or contains a 
             single :class:`.DisruptionToken`.
             List has length :attr:`numFrequencyBins`.
+            The same list is reused (and overwritten) every time step.
         
         Todo
         ----
@@ -139,7 +172,8 @@ class DisruptorPlatform(Platform):
         numTokensToUse = min(self.numTokensRemaining, 1)  #FIXME
         
         # Initialize disruption tokens
-        tokens = [None] * self.numFrequencyBins
+        tokens = self._tokBuf
+        tokens[:] = (None,) * len(tokens)
 
         # Ensure number of disruption tokens is not greater than number of frequency bins
         if numTokensToUse > self.numFrequencyBins:
@@ -150,9 +184,16 @@ class DisruptorPlatform(Platform):
         self.numTokensRemaining -= numTokensToUse
 
         # Assign tokens to frequency bins
-        index = random.sample(range(self.numFrequencyBins), numTokensToUse)
+        if numTokensToUse == 0:
+            return tokens
+        if numTokensToUse == 1:
+            index = (_randrange(self.numFrequencyBins),)
+        else:
+            index = _sample(self._binRange, numTokensToUse)
+        acquireToken = DisruptionToken.acquire
         for i in index:
-            tokens[i] = DisruptionToken(self.id, self.commsDestIDs, self.elapsedTime)
-            tokens[i].freqBin = i
-            tokens[i].position = self.pos
+            theToken = acquireToken(self.id, self.commsDestIDs, self.elapsedTime)
+            theToken.freqBin = i
+            theToken.position = self.pos     # pos is a copy, so is not changed by later time steps
+            tokens[i] = theToken
         return tokens
@@ -1,5 +1,4 @@
 import numpy as np
-import argparse
 
 class Platform:
     """
@@ -18,6 +17,12 @@ class Platform:
     acc : numpy.ndarray
         The current acceleration in cartesian coordinates.
         Array has length 3 and is specified as :math:`[a_x,a_y,a_z]`.
+    state : numpy.ndarray
+        The current position, velocity, and acceleration.
+        Array has shape (3, 3), with rows :attr:`pos`, :attr:`vel`, and 
+        :attr:`acc`, respectively.
+        When this platform is part of an :class:`.Environment`, this 
+        array is a view into :attr:`.Environment.platformStates`.
     elapsedTime : float
         The number of simulated seconds that have passed since the 
         simulation began.
@@ -25,8 +30,18 @@ class Platform:
         The number of time steps that have passed since the 
         simulation began (i.e., number of times :meth:`step` has been 
         called).
+
+    Note
+    ----
+    :attr:`pos`, :attr:`vel`, and :attr:`acc` return copies of the rows 
+    of :attr:`state`, so arrays obtained from them are not changed by 
+    later time steps (and changing their elements does not change this 
+    platform).
+    Assign to these attributes to change the state of this platform.
     """
 
+    __slots__ = ('id', 'state', 'elapsedTime', 'elapsedTimeSteps')
+
     def __init__ ( self, theID, initialPos=[0,0,0], initialVel=[0,0,0], initialAcc=[0,0,0] ):
         """
         Parameters
@@ -45,64 +60,85 @@ class Platform:
             List has length 3 and is specified as :math:`[a_x,a_y,a_z]`.
         """
         
-        parser = argparse.ArgumentParser(description='Verify user input.')
-
         self.id = theID
         
-        self.pos = np.array(initialPos, dtype=np.float64)
-        self.vel = np.array(initialVel, dtype=np.float64)
-        self.acc = np.array(initialAcc, dtype=np.float64)
+        self.state = np.array([initialPos, initialVel, initialAcc], dtype=np.float64)
 
         # Initialize time elapsed counter (seconds)
         self.elapsedTime = 0
         # Initialize time step counter (number of time steps)
         self.elapsedTimeSteps = 0
 
+    @property
+    # Specify position as the first row of state
+    def pos(self):
+        # Copy, as state is updated in place every time step
+        return self.state[0].copy()
+    @pos.setter
+    def pos(self, value):
+        self.state[0] = value
+
+    @property
+    # Specify velocity as the second row of state
+    def vel(self):
+        return self.state[1].copy()
+    @vel.setter
+    def vel(self, value):
+        self.state[1] = value
+
+    @property
+    # Specify acceleration as the third row of state
+    def acc(self):
+        return self.state[2].copy()
+    @acc.setter
+    def acc(self, value):
+        self.state[2] = value
+
     def posX ( self ):
         """
         The first position coordinate (:math:`p_x`).
         """
-        return self.pos[0]
+        return self.state[0, 0]
     def posY ( self ):
         """
         The second position coordinate (:math:`p_y`).
         """
-        return self.pos[1]
+        return self.state[0, 1]
     def posZ ( self ):
         """
         The third position coordinate (:math:`p_z`).
         """
-        return self.pos[2]
+        return self.state[0, 2]
     def velX ( self ):
         """
         The first velocity coordinate (:math:`v_x`).
         """
-        self.vel[0]
+        return self.state[1, 0]
     def velY ( self ):
         """
         The second velocity coordinate (:math:`v_y`).
         """
-        return self.vel[1]
+        return self.state[1, 1]
     def velZ ( self ):
         """
         The third velocity coordinate (:math:`v_z`).
         """
-        return self.vel[2]
+        return self.state[1, 2]
     def accX ( self ):
         """
         The first acceleration coordinate (:math:`a_x`).
         """
-        return self.acc[0]
+        return self.state[2, 0]
     def accY ( self ):
         """
         The second acceleration coordinate (:math:`a_y`).
         """
-        return self.acc[1]
+        return self.state[2, 1]
     def accZ ( self ):
         """
         The third acceleration coordinate (:math:`a_z`).
         """
-        return self.acc[2]
+        return self.state[2, 2]
     
 
     def step(self, deltaT):
@@ -116,14 +152,49 @@ class Platform:
             The number of seconds to advance the platform by.
         """
 
-        # Update position, velocity, and acceleration
-        mtx = np.array([[1, deltaT, 0.5*deltaT**2], [0, 1, deltaT], [0, 0, 1]], dtype=np.float64)
-        state = np.matmul(mtx, np.concatenate([[self.pos], [self.vel], [self.acc]],axis=0))
-        self.pos = state[0]
-        self.vel = state[1]
-        self.acc = state[2]
-        
+        # Update position and velocity (acceleration is constant)
+        state = self.state
+        state[0] += state[1]*deltaT + state[2]*(0.5*deltaT*deltaT)
+        state[1] += state[2]*deltaT
+
+        self.advanceTime(deltaT)
+
+    def advanceTime ( self, deltaT ):
+        """
+        Advance the platform's elapsed time by ``deltaT`` seconds and 
+        onto the next time step, without updating its position, 
+        velocity, and acceleration.
+
+        Parameters
+        ----------
+        deltaT : float
+            The number of seconds to advance the platform by.
+
+        Warning
+        -------
+        Method is typically called automatically by :meth:`step` or by 
+        the :class:`.Environment` (which updates the position, velocity, 
+        and acceleration of all platforms at once) and is not intended 
+        to be called directly by the user.
+        """
+
         # Update elapsed simulation time
         self.elapsedTime += deltaT
         self.elapsedTimeSteps += 1
+
+    def reset ( self ):
+        """
+        Return the platform to the beginning of the simulation.
+        The position, velocity, and acceleration are restored by the 
+        :class:`.Environment`.
+
+        Warning
+        -------
+        Method is typically called automatically by the 
+        :class:`.Environment` and is not intended to be called 
+        directly by the user.
+        """
+
+        self.elapsedTime = 0
+        self.elapsedTimeSteps = 0
         
\ No newline at end of file
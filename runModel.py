@@ -34,16 +34,18 @@ env = Environment(adjMatrix, allPlatforms, theDisruptor, numberOfFrequencyBins,
 # Run simulation
 deltaT = 0.25
 numSteps = 20
+rnd = random.random
+smp = random.sample
 for t in range(numSteps):
     for p in allPlatforms:
         # Determine if data should be added to transmit queue
-        doTxData = bool(random.random() > 0.5)
+        doTxData = bool(rnd() > 0.5)
         # Create data to add to transmit queue
         if doTxData:
             # Assign random data payload
-            txPayload = random.random()
+            txPayload = rnd()
             # Assign random destination
-            destID = random.sample(p.destIDs, 2)
+            destID = smp(p.destIDs, 2)
             # Add packet to transmit queue
             p.txData(txPayload, destID)
 
@@ -0,0 +1,28 @@
+import functools
+import numpy as np
+
+@functools.lru_cache(maxsize=None)
+def allTrueAdjMatrix ( n ):
+    """
+    Obtain a fully connected connectivity/adjacency matrix of size 
+    ``n`` x ``n``.
+    The same read-only array is shared by all tests, so copy it before 
+    modifying any of its entries.
+    """
+    adjMatrix = np.ones((n,n), dtype=bool)
+    adjMatrix.flags.writeable = False
+    return adjMatrix
+
+@functools.lru_cache(maxsize=None)
+def payloadSequence ( numPayloads, numSequences=None ):
+    """
+    Obtain deterministic random data payloads, drawn from a generator 
+    seeded with 0, so that tests are repeatable.
+    Returns a tuple of ``numPayloads`` floats, or a tuple of 
+    ``numSequences`` such tuples if specified.
+    The same sequences are shared by all tests.
+    """
+    rng = np.random.RandomState(0)
+    if numSequences is None:
+        return tuple(rng.random_sample(numPayloads).tolist())
+    return tuple(tuple(row) for row in rng.random_sample((numSequences, numPayloads)).tolist())
@@ -1,6 +1,6 @@
 from acme.platforms.CommsPlatform import CommsPlatform
 from acme.coordinators.CommsCoordinator import CommsCoordinator
-import random
+from helpers import payloadSequence
 import numpy as np
 import unittest
 
@@ -17,8 +17,6 @@ class TestCommsCoordinator ( unittest.TestCase ):
         self.platforms = allPlatforms
 
     
-    #FIXME
-    @unittest.skip
     def test_roundRobin ( self ):
         """
         Test that ensures Round Robin works correctly
@@ -31,16 +29,22 @@ class TestCommsCoordinator ( unittest.TestCase ):
 
         # Create and transmit data
         numSteps = 20
-        txPayloads = [None] * len(allPlatforms)
+        txPayloads = payloadSequence(numSteps, len(allPlatforms))
         for pIndex, p in enumerate(allPlatforms):
-            txPayloads[pIndex] = [random.random() for t in range(numSteps)]
-            for t in range(numSteps):
-                p.txData(txPayloads[pIndex][t], [(pIndex+1)%len(allPlatforms)])
+            p.txDataBulk(txPayloads[pIndex], [(pIndex+1)%len(allPlatforms)])
         
+        # Each platform with data to transmit fills the next frequency bin
         for t in range(numSteps):
             theData = coordinator.step()
             for binIndex in range(numFrequencyBins):
-                self.assertEqual(theData[binIndex].payload, txPayloads[0])
+                self.assertEqual(theData[binIndex].payload, txPayloads[binIndex][t])
+                self.assertEqual(theData[binIndex].freqBin, binIndex)
+
+        # Frequency bins are filled only as platforms actually have data to transmit
+        allPlatforms[1].txData(0.5, [0])
+        theData = coordinator.step()
+        self.assertEqual(theData[0].payload, 0.5)
+        self.assertIsNone(theData[1])
 
 
     #TODO
@@ -51,9 +55,12 @@ class TestCommsCoordinator ( unittest.TestCase ):
         allPlatforms = self.platforms
 
         # Instantiate CommsCoordinator
-        numFrequencyBins = 2
+        numFrequencyBins = 1
         coordinator = CommsCoordinator(allPlatforms, numFrequencyBins, "tdma")
 
+        # Only one frequency bin may exist
+        self.assertRaises(ValueError, CommsCoordinator, allPlatforms, 2, "tdma")
+
         
     #TODO
     def test_fdma ( self ):
@@ -1,5 +1,7 @@
 from acme.platforms.CommsPlatform import CommsPlatform
 from acme.Environment import Environment
+from acme.EmissionObj import Packet
+from helpers import allTrueAdjMatrix
 import numpy as np
 import unittest
 
@@ -16,7 +18,7 @@ class TestCommsPlatform ( unittest.TestCase ):
         allPlatforms = (platform1, platform2)
 
         # Define connectivity/adjacency matrix
-        adjMatrix = np.full((2,2), True, dtype=bool)
+        adjMatrix = allTrueAdjMatrix(2)
         
         # Instantiate Environment
         self.assertRaises(AssertionError, Environment, adjMatrix, allPlatforms)
@@ -33,7 +35,7 @@ class TestCommsPlatform ( unittest.TestCase ):
         platform = CommsPlatform(theID)
 
         # Define connectivity/adjacency matrix
-        adjMatrix = np.full((1,1), True, dtype=bool)
+        adjMatrix = allTrueAdjMatrix(1)
 
         # Instantiate Environment
         env = Environment(adjMatrix, (platform,))
@@ -46,5 +48,99 @@ class TestCommsPlatform ( unittest.TestCase ):
         self.assertRaises(AssertionError, platform.txData, thePayload, [theID+1])
 
 
+    def test_payloadCopy ( self ):
+        """
+        Test that ensures mutable payloads are copied when transmitted and received
+        """
+        # Instantiate CommsPlatforms
+        platform1 = CommsPlatform(1)
+        platform2 = CommsPlatform(2)
+
+        # Define connectivity/adjacency matrix
+        adjMatrix = allTrueAdjMatrix(2)
+
+        # Instantiate Environment
+        env = Environment(adjMatrix, (platform1, platform2))
+
+        # Transmit data and then modify it before it is delivered
+        thePayload = [1, 2, 3]
+        platform1.txData(thePayload, [2])
+        thePayload.append(4)
+        env.step(0.25)
+
+        theRxData = platform2.rxData()
+        self.assertEqual(theRxData, [1, 2, 3])
+        self.assertIsNot(theRxData, thePayload)
+
+        # Subclasses of immutable types are copied as well
+        class TaggedInt ( int ):
+            pass
+        thePayload = TaggedInt(5)
+        thePayload.tags = []
+        platform1.txData(thePayload, [2])
+        env.step(0.25)
+        theRxData = platform2.rxData()
+        self.assertEqual(theRxData, 5)
+        self.assertIsNot(theRxData, thePayload)
+
+
+    def test_getDataBatch ( self ):
+        """
+        Test that ensures packets are obtained from the transmit queue in order and only up to the number requested
+        """
+        # Instantiate CommsPlatform
+        platform = CommsPlatform(1)
+
+        # Queue data for transmission
+        for thePayload in range(3):
+            platform.txData(thePayload, [2])
+
+        self.assertEqual([thePacket.payload for thePacket in platform.getDataBatch(2)], [0, 1])
+        self.assertEqual([thePacket.payload for thePacket in platform.getDataBatch(2)], [2])
+        self.assertEqual(platform.getDataBatch(2), [])
+
+
+    def test_destIDs ( self ):
+        """
+        Test that ensures destination IDs may be given as a list or tuple and are stored as a tuple
+        """
+        platform = CommsPlatform(1)
+
+        platform.destIDs = [2, 3]
+        self.assertEqual(platform.destIDs, (2, 3))
+        platform.destIDs = (3, 4)
+        self.assertEqual(platform.destIDs, (3, 4))
+        with self.assertRaises(ValueError):
+            platform.destIDs = {2, 3}
+
+
+    def test_txDataBulk ( self ):
+        """
+        Test that ensures payloads transmitted in bulk are queued in order, up to the size of the transmit queue
+        """
+        platform = CommsPlatform(1, theMaxSize=3)
+
+        with self.assertWarns(UserWarning) as cm:
+            platform.txDataBulk(np.arange(5.0), [2])
+        self.assertEqual(len(cm.warnings), 1)
+        thePackets = list(platform.txQueue)
+        self.assertEqual([thePacket.payload for thePacket in thePackets], [0.0, 1.0, 2.0])
+        self.assertIs(type(thePackets[0].payload), float)
+        self.assertEqual([thePacket.msgID for thePacket in thePackets], [1, 2, 3])
+
+
+    def test_queueFullWarning ( self ):
+        """
+        Test that ensures a full receive queue drops data and warns only once per time step
+        """
+        platform = CommsPlatform(1, theMaxSize=1, theDoAck=False)
+
+        thePackets = [Packet.acquire(2, [1], 0.0, thePayload, thePayload) for thePayload in range(3)]
+        with self.assertWarns(UserWarning) as cm:
+            platform.putData(thePackets)
+        self.assertEqual(len(cm.warnings), 1)
+        self.assertEqual(list(platform.rxQueue), [0])
+
+
 #if __name__ == '__main__':
 #    unittest.main()
@@ -0,0 +1,56 @@
+from acme.EmissionObj import Packet
+from acme.EmissionObj import AckPacket
+from acme.EmissionObj import EmissionObj
+import unittest
+
+class TestEmissionObj ( unittest.TestCase ):
+
+    def test_pool ( self ):
+        """
+        Test that ensures released emission objects are reused and fully re-initialized
+        """
+        thePacket = Packet.acquire(1, [2], 0.0, 'payload', 1)
+        thePacket.emissionTime = 0.25
+        thePacket.freqBin = 3
+        thePacket.release()
+
+        # Released object is reused by the same class only
+        theAckPacket = AckPacket.acquire(2, [1], 0.5, 1, 1)
+        self.assertIsNot(theAckPacket, thePacket)
+        theNewPacket = Packet.acquire(3, [4], 0.5, 'newPayload', 2)
+        self.assertIs(theNewPacket, thePacket)
+
+        self.assertEqual(theNewPacket.sourceID, 3)
+        self.assertEqual(theNewPacket.destID, [4])
+        self.assertEqual(theNewPacket.time, 0.5)
+        self.assertEqual(theNewPacket.payload, 'newPayload')
+        self.assertEqual(theNewPacket.msgID, 2)
+        self.assertIsNone(theNewPacket.emissionTime)
+        self.assertEqual(theNewPacket.freqBin, 0)
+        self.assertIsNone(theNewPacket.position)
+
+        # Subclasses do not share pools with their parent class
+        class SubPacket ( Packet ):
+            pass
+        Packet.acquire(1, [2], 0.0, 'payload', 3).release()
+        theSubPacket = SubPacket.acquire(1, [2], 0.0, 'payload', 4)
+        self.assertIs(type(theSubPacket), SubPacket)
+        theSubPacket.release()
+        self.assertIs(type(Packet.acquire(1, [2], 0.0, 'payload', 5)), Packet)
+        self.assertIs(SubPacket.acquire(1, [2], 0.0, 'payload', 6), theSubPacket)
+
+
+    def test_unknownSourceType ( self ):
+        """
+        Test that ensures emission classes must have a known source platform type
+        """
+        with self.assertRaises(Exception):
+            class UnknownEmission ( EmissionObj ):
+                pass
+        with self.assertRaises(Exception):
+            class InvalidEmission ( EmissionObj ):
+                sourceType = 2
+
+
+#if __name__ == '__main__':
+#    unittest.main()
@@ -1,144 +1,282 @@
 from acme.platforms.CommsPlatform import CommsPlatform
 from acme.platforms.DisruptorPlatform import DisruptorPlatform
 from acme.Environment import Environment
-import random
+from helpers import allTrueAdjMatrix
+from helpers import payloadSequence
 import numpy as np
-import queue
-import copy
+import collections
 import unittest
 
+# Fields of emission objects recorded in snapshots of the Environment
+snapshotDtype = np.dtype([('sourceID', 'i8'), ('destID', 'O'), ('payload', 'f8'), ('msgID', 'i8'), ('freqBin', 'i8'), ('present', '?')])
+
+def snapshotEnv ( theData ):
+    """
+    Record the fields of all emission objects in an Environment status 
+    (in the form of :attr:`.Environment.data`), so that the status can 
+    be compared after the emission objects have been reused.
+    """
+    snap = np.zeros((len(theData), len(theData[0])), dtype=snapshotDtype)
+    for snapRow, rowData in zip(snap, theData):
+        for binIndex, emission in enumerate(rowData):
+            if emission:
+                snapRow[binIndex] = (emission.sourceID, list(emission.destID), emission.payload, emission.msgID, emission.freqBin, True)
+    return snap
+
 class TestEnvironment ( unittest.TestCase ):
 
+    @classmethod
+    def setUpClass ( cls ):
+        # Instantiate CommsPlatforms
+        cls.platforms = (CommsPlatform(1), CommsPlatform(2), CommsPlatform(3))
+
+        # Instantiate DisruptorPlatform
+        cls.disruptor = DisruptorPlatform(1, 0)
+
+        # Define connectivity/adjacency matrix
+        adjMatrix = allTrueAdjMatrix(4)
+
+        # Instantiate Environment (shared by tests, and reset after each test)
+        cls.env = Environment(adjMatrix, cls.platforms, (cls.disruptor,), theDisruptorDelay=2)
+
+        # Instantiate Environment with default configuration and no DisruptorPlatform
+        cls.noDisruptorPlatforms = (CommsPlatform(1), CommsPlatform(2), CommsPlatform(3))
+        # Position is changed after the platform is constructed, so reset must return to this position rather than the constructor's
+        cls.noDisruptorPlatforms[0].pos = [1.0, 2.0, 3.0]
+        cls.noDisruptorEnv = Environment(allTrueAdjMatrix(3), cls.noDisruptorPlatforms)
+
+        # Instantiate Environment with two CommsPlatforms and the default disruptor delay
+        cls.defaultDelayPlatforms = (CommsPlatform(1), CommsPlatform(2))
+        cls.defaultDelayDisruptor = DisruptorPlatform(1, 0)
+        cls.defaultDelayEnv = Environment(allTrueAdjMatrix(3), cls.defaultDelayPlatforms, (cls.defaultDelayDisruptor,))
+
+    def tearDown ( self ):
+        self.env.reset()
+        self.noDisruptorEnv.reset()
+        self.defaultDelayEnv.reset()
+
+
     def test_dataTransfer ( self ):
         """
         Test that ensures data transferred by one CommsPlatform is received by the intended Comms Platforms
         """
-        # Instantiate CommsPlatforms
-        platform1 = CommsPlatform(1)
-        platform2 = CommsPlatform(2)
-        platform3 = CommsPlatform(3)
-        allPlatforms = (platform1, platform2, platform3)
-        rxPlatforms = [platform2, platform3]
-        nonRxPlatforms = [platform1]
+        # Run with a disruptor and without one
+        configs = (("shared", self.platforms, self.env),
+                   ("noDisruptor", self.noDisruptorPlatforms, self.noDisruptorEnv))
 
-        # Define connectivity/adjacency matrix
-        adjMatrix = np.full((3,3), True, dtype=bool)
-        
-        # Instantiate Environment
-        env = Environment(adjMatrix, allPlatforms)
+        for configName, thePlatforms, env in configs:
+            platform1, platform2, platform3 = thePlatforms
+            # Each platform and whether it is supposed to receive the data
+            probes = ((platform1, False), (platform2, True), (platform3, True))
 
-        # Create and transmit data
-        numSteps = 20
-        txPayloads = [random.random() for i in range(numSteps)]
+            for numSteps in (20, 50, 100):
+                with self.subTest(config=configName, numSteps=numSteps):
+                    # Start each simulation from the beginning
+                    env.reset()
+
+                    # Create and transmit data
+                    txPayloads = payloadSequence(numSteps)
         
-        # Run simulation
-        deltaT = 0.25
-        for t in range(numSteps):
-            platform1.txData(txPayloads[t], [2,3])
+                    # Run simulation
+                    deltaT = 0.25
+                    # Received data (and the data expected), where no data is recorded as NaN
+                    observedRxData = []
+                    expectedRxData = []
+                    for t in range(numSteps):
+                        platform1.txData(txPayloads[t], [2,3])
         
-            # Ensure platforms receive correct data
-            for p in rxPlatforms:
-                # Obtain any received data
-                theRxData = p.rxData()
-
-                if t == 0:
-                    self.assertEqual(theRxData, None)
-                else:
-                    self.assertEqual(theRxData, txPayloads[t-1])
-            
-            # Ensure platforms that are not supposed to receive any data in fact have not
-            for p in nonRxPlatforms:
-                # Obtain any received data
-                theRxData = p.rxData()
-                self.assertEqual(theRxData, None)
+                        # Record data received by platforms, and whether platforms that are not supposed to receive any data in fact have not
+                        for p, isReceiver in probes:
+                            # Obtain any received data
+                            theRxData = p.rxData()
 
-            # Step simulation
-            env.step(deltaT)
+                            observedRxData.append(np.nan if theRxData is None else theRxData)
+                            expectedRxData.append(txPayloads[t-1] if isReceiver and t > 0 else np.nan)
+
+                        # Step simulation
+                        env.step(deltaT)
+
+                    # Ensure platforms receive correct data
+                    np.testing.assert_array_equal(observedRxData, expectedRxData)
 
 
     def test_delay ( self ):
         """
         Test that ensures Disruptor Platform awareness of the Environment is delayed correctly
         """
-        # Instantiate CommsPlatforms
-        platform1 = CommsPlatform(1)
-        platform2 = CommsPlatform(2)
-        platform3 = CommsPlatform(3)
-        allPlatforms = (platform1, platform2, platform3)
-        
-        # Instantiate DisruptorPlatform
-        disruptor = DisruptorPlatform(1, 0)
-        
-        # Define connectivity/adjacency matrix
-        adjMatrix = np.full((4,4), True, dtype=bool)
-        
-        # Instantiate Environment
-        delay = 2
-        env = Environment(adjMatrix, allPlatforms, (disruptor,), theDisruptorDelay=delay)
+        platform1 = self.platforms[0]
+        disruptor = self.disruptor
+        env = self.env
+        delay = env.disruptorDelay
 
         # Create and transmit data
         numSteps = 20
-        txPayloads = [random.random() for i in range(numSteps)]
+        txPayloads = payloadSequence(numSteps)
         
         # Run simulation
         deltaT = 0.25
-        envQueue = queue.Queue()
+        envQueue = collections.deque(maxlen=delay+1)
         for t in range(numSteps):
             platform1.txData(txPayloads[t], [2])
 
-            envQueue.put(copy.deepcopy(env.data))
+            envQueue.append(snapshotEnv(env.data))
             
             # Compare current value from Environment with delayed value from Disruptor
             if t >= delay:
-                pastEnv = envQueue.get()
-                for platformIndex in range(len(env.data)):
-                    for binIndex in range(env.numFrequencyBins):
-                        if pastEnv[platformIndex][binIndex]:
-                            self.assertEqual(pastEnv[platformIndex][binIndex].sourceID, disruptor.env[platformIndex][binIndex].sourceID)
-                            self.assertEqual(pastEnv[platformIndex][binIndex].destID, disruptor.env[platformIndex][binIndex].destID)
-                            self.assertEqual(pastEnv[platformIndex][binIndex].payload, disruptor.env[platformIndex][binIndex].payload)
-                            self.assertEqual(pastEnv[platformIndex][binIndex].msgID, disruptor.env[platformIndex][binIndex].msgID)
-                            self.assertEqual(pastEnv[platformIndex][binIndex].freqBin, disruptor.env[platformIndex][binIndex].freqBin)
-                            #self.assertEqual(pastEnv[platformIndex][binIndex].position, disruptor.env[platformIndex][binIndex].position)
-                        else:
-                            self.assertEqual(pastEnv[platformIndex][binIndex], disruptor.env[platformIndex][binIndex])
+                pastEnv = envQueue.popleft()
+                disruptorEnv = snapshotEnv(disruptor.env)
+                with self.subTest(t=t):
+                    if not np.array_equal(pastEnv, disruptorEnv):
+                        # Locate the mismatch
+                        for field in snapshotDtype.names:
+                            np.testing.assert_array_equal(pastEnv[field], disruptorEnv[field], err_msg="Field '{}' differs".format(field))
+                        self.fail("Environment status differs")
 
             # Step simulation
             env.step(deltaT)
 
 
-    def test_time ( self ):
+    def test_observability ( self ):
         """
-        Test that ensures that emissions have the correct time of creation
+        Test that ensures Disruptor Platforms only observe emissions from platforms they are connected to
         """
-        # Instantiate CommsPlatform
+        # Instantiate CommsPlatforms
         platform1 = CommsPlatform(1)
         platform2 = CommsPlatform(2)
         allPlatforms = (platform1, platform2)
-        
+
         # Instantiate DisruptorPlatform
         disruptor = DisruptorPlatform(1, 0)
-        
+
         # Define connectivity/adjacency matrix
-        adjMatrix = np.full((3,3), True, dtype=bool)
-        
+        # Disruptor can observe platform2 but not platform1
+        adjMatrix = allTrueAdjMatrix(3).copy()
+        adjMatrix[0,2] = False
+
         # Instantiate Environment
-        env = Environment(adjMatrix, allPlatforms, (disruptor,))
+        env = Environment(adjMatrix, allPlatforms, (disruptor,), theDisruptorDelay=1)
 
-        # Create and transmit data
+        # Run simulation
+        deltaT = 0.25
+        platform1.txData(0.0, [2])
+        platform2.txData(1.0, [1])
+        env.step(deltaT)
+        env.step(deltaT)
+
+        observedSourceIDs = [emission.sourceID for emission in disruptor.env[0] if emission is not None]
+        self.assertEqual(observedSourceIDs, [2])
+
+
+    def test_trafficStatistics ( self ):
+        """
+        Test that ensures traffic statistics account for links that are not active
+        """
+        # Instantiate CommsPlatforms
+        platform1 = CommsPlatform(1)
+        platform2 = CommsPlatform(2)
+        allPlatforms = (platform1, platform2)
+
+        # Define connectivity/adjacency matrix
+        # platform1 can transmit to platform2, but acknowledgements from platform2 are never delivered
+        adjMatrix = allTrueAdjMatrix(2).copy()
+        adjMatrix[1,0] = False
+
+        # Instantiate Environment
+        env = Environment(adjMatrix, allPlatforms, theSlidingWindow=1.0)
+
+        # Run simulation
+        deltaT = 0.25
         numSteps = 20
-        txPayloads = [random.random() for i in range(numSteps)]
-        
+        platform1.txDataBulk(range(numSteps), [2])
+        theTrafficStatistics = []
+        env.stepMany(numSteps, deltaT, lambda t, env: theTrafficStatistics.append(env.trafficStatistics))
+
+        for t, statMatrix in enumerate(theTrafficStatistics):
+            with self.subTest(t=t):
+                np.testing.assert_array_equal(statMatrix, [[0.0, 1.0], [0.0, 0.0]])
+
+
+    def test_time ( self ):
+        """
+        Test that ensures that emissions have the correct time of creation
+        """
+        # Run with a disruptor delay of two time steps and with the default delay
+        configs = (("shared", self.platforms[0], self.disruptor, self.env),
+                   ("defaultDelay", self.defaultDelayPlatforms[0], self.defaultDelayDisruptor, self.defaultDelayEnv))
+
+        for configName, platform1, disruptor, env in configs:
+            env.reset()
+
+            # Create and transmit data
+            numSteps = 20
+            txPayloads = payloadSequence(numSteps)
+
+            # Run simulation
+            deltaT = 0.25
+            for t in range(numSteps):
+                platform1.txData(txPayloads[t], [2])
+                # Verify emission time is correct
+                if t > env.disruptorDelay:
+                    with self.subTest(config=configName, t=t):
+                        self.assertEqual(disruptor.env[0][0].time, deltaT * (t-env.disruptorDelay-1))
+
+                # Step simulation
+                env.step(deltaT)
+
+
+    def test_positionHistory ( self ):
+        """
+        Test that ensures positions obtained from a platform are not changed by later time steps
+        """
+        platform1 = self.platforms[0]
+        env = self.env
+        platform1.vel = [4.0, 0.0, 0.0]
+
+        # Run simulation, recording position every time step
+        deltaT = 0.25
+        history = []
+        for t in range(3):
+            env.step(deltaT)
+            history.append(platform1.pos)
+
+        np.testing.assert_array_equal(history, [[1.0, 0.0, 0.0], [2.0, 0.0, 0.0], [3.0, 0.0, 0.0]])
+
+
+    def test_reset ( self ):
+        """
+        Test that ensures resetting the Environment returns the simulation to its beginning
+        """
+        platform1, platform2, platform3 = self.platforms
+        env = self.env
+        platform1.vel = [1.0, 0.0, 0.0]
+
         # Run simulation
         deltaT = 0.25
-        for t in range(numSteps):
-            platform1.txData(txPayloads[t], [2])
-            # Verify emission time is correct
-            if t > env.disruptorDelay:
-                self.assertEqual(disruptor.env[0][0].time, deltaT * (t-env.disruptorDelay-1))
-            
-            # Step simulation
+        for t in range(5):
+            platform1.txData(t, [2])
             env.step(deltaT)
+        platform1.txData(5, [2])
+        env.reset()
+
+        self.assertEqual(env.elapsedTime, 0)
+        self.assertEqual(platform1.elapsedTimeSteps, 0)
+        np.testing.assert_array_equal(platform1.pos, [0.0, 0.0, 0.0])
+        self.assertEqual(len(platform1.txQueue), 0)
+        self.assertIsNone(platform2.rxData())
+        self.assertIsNone(self.disruptor.env)
+        np.testing.assert_array_equal(env.trafficStatistics, np.zeros((3,3)))
+
+        # Disruptor observes nothing until the delay has passed
+        env.step(deltaT)
+        self.assertTrue(all(emission is None for emission in self.disruptor.env[0]))
+
+        # Platforms return to their state when the Environment was constructed
+        platform1 = self.noDisruptorPlatforms[0]
+        platform1.vel = [1.0, 0.0, 0.0]
+        self.noDisruptorEnv.step(deltaT)
+        self.noDisruptorEnv.reset()
+        np.testing.assert_array_equal(platform1.pos, [1.0, 2.0, 3.0])
+        np.testing.assert_array_equal(platform1.vel, [0.0, 0.0, 0.0])
 
 
 #if __name__ == '__main__':
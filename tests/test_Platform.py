@@ -0,0 +1,42 @@
+from acme.platforms.Platform import Platform
+import numpy as np
+import unittest
+
+class TestPlatform ( unittest.TestCase ):
+
+    def test_kinematics ( self ):
+        """
+        Test that ensures position and velocity are updated correctly under constant acceleration
+        """
+        initialPos = [1.0, -2.0, 3.0]
+        initialVel = [0.5, 0.0, -1.0]
+        initialAcc = [0.0, 2.0, 0.25]
+        platform = Platform(0, initialPos, initialVel, initialAcc)
+
+        # Run simulation
+        deltaT = 0.25
+        numSteps = 20
+        for t in range(numSteps):
+            platform.step(deltaT)
+
+        elapsedTime = deltaT * numSteps
+        np.testing.assert_allclose(platform.pos, np.add(initialPos, np.multiply(initialVel, elapsedTime)) + 0.5 * np.multiply(initialAcc, elapsedTime**2))
+        np.testing.assert_allclose(platform.vel, np.add(initialVel, np.multiply(initialAcc, elapsedTime)))
+        np.testing.assert_allclose(platform.acc, initialAcc)
+        self.assertEqual(platform.elapsedTimeSteps, numSteps)
+        self.assertAlmostEqual(platform.elapsedTime, elapsedTime)
+
+
+    def test_accessors ( self ):
+        """
+        Test that ensures the coordinate accessors return the matching components of position, velocity, and acceleration
+        """
+        platform = Platform(0, [1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0])
+
+        self.assertEqual((platform.posX(), platform.posY(), platform.posZ()), (1.0, 2.0, 3.0))
+        self.assertEqual((platform.velX(), platform.velY(), platform.velZ()), (4.0, 5.0, 6.0))
+        self.assertEqual((platform.accX(), platform.accY(), platform.accZ()), (7.0, 8.0, 9.0))
+
+
+#if __name__ == '__main__':
+#    unittest.main()